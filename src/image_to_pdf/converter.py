@@ -6,15 +6,164 @@ This module provides the ImageToPDFConverter class for converting images to PDF.
 
 from __future__ import annotations
 
+import functools
+import gc
 import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Set, Union
+from typing import Callable, ClassVar, FrozenSet, Iterator, List, Optional, Tuple, Union
 
-import pillow_heif
 from PIL import Image
 
-# Register HEIF opener with Pillow
-pillow_heif.register_heif_opener()
+_HEIF_SUFFIXES = (".heic", ".heif")
+_heif_lock = threading.Lock()
+_heif_registered = False
+
+
+def _ensure_heif() -> None:
+    """
+    Register pillow_heif's opener on first HEIC/HEIF use.
+
+    Importing pillow_heif loads the libheif shared library and costs
+    ~50-100ms of startup latency, so it is deferred until a HEIC/HEIF
+    file is actually encountered. Safe to call from worker threads.
+
+    HEIC decode is the dominant per-image cost for Apple-sourced
+    libraries: let libheif spread HEVC tile decoding across cores, and
+    allow users with an accelerated libheif decoder plugin (loaded via
+    LIBHEIF_PLUGIN_PATH, e.g. an FFmpeg HEVC build) to select it.
+    """
+    global _heif_registered
+    if _heif_registered:
+        return
+    with _heif_lock:
+        if _heif_registered:
+            return
+        import pillow_heif
+
+        pillow_heif.register_heif_opener()
+        pillow_heif.options.DECODE_THREADS = os.cpu_count() or 1
+        preferred_decoder = os.environ.get("IMAGE_TO_PDF_HEIF_DECODER")
+        if preferred_decoder:
+            pillow_heif.options.PREFERRED_DECODER["HEIF"] = preferred_decoder
+        _heif_registered = True
+
+# Optional lossless PDF assembly: img2pdf embeds original JPEG bitstreams
+# instead of re-encoding them, used when a whole batch needs no preparation.
+try:
+    import img2pdf as _img2pdf
+except ImportError:
+    _img2pdf = None
+
+# Optional libvips backend: thumbnail() streams scanlines through decode
+# and resize in one demand-driven pass, never materializing the full-
+# resolution frame. The import raises OSError (not ImportError) when the
+# wheel is installed but the libvips shared library is missing.
+try:
+    import pyvips as _pyvips
+except (ImportError, OSError):
+    _pyvips = None
+
+# Optional SIMD-accelerated resizer (AVX2/SSE4.1 lanczos3 convolution).
+# Falls back to Pillow's scalar LANCZOS when cykooz.resizer isn't installed.
+try:
+    from cykooz.resizer import CpuExtensions, FilterType, ResizeAlg, Resizer
+except ImportError:
+    Resizer = None
+
+# Resizer instances mutate internal intermediate buffers on every call,
+# so one shared instance isn't safe under the thread pool. Each worker
+# thread lazily builds its own, reused across that thread's pages.
+_resizer_pool = threading.local()
+
+
+def _get_resizer() -> Optional["Resizer"]:
+    """Return this thread's SIMD resizer, or None if unavailable."""
+    if Resizer is None:
+        return None
+    resizer = getattr(_resizer_pool, "resizer", None)
+    if resizer is None:
+        resizer = Resizer(ResizeAlg.convolution(FilterType.lanczos3))
+        resizer.cpu_extensions = CpuExtensions.avx2
+        _resizer_pool.resizer = resizer
+    return resizer
+
+# Optional NumPy-backed RGBA->RGB flattening. Pillow flattens alpha in
+# scalar C over several intermediate images; the array version composites
+# against white into a pooled per-thread buffer. Falls back to the Pillow
+# path when numpy isn't installed.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional LLVM-vectorized upgrade of the same kernel: one parallel
+# traversal writing straight into the pooled buffer.
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rgba_to_rgb(src, dst):  # pragma: no cover - compiled
+        h, w = src.shape[:2]
+        for y in prange(h):
+            for x in range(w):
+                a = int(src[y, x, 3])
+                inv = 255 - a
+                dst[y, x, 0] = (src[y, x, 0] * a + 255 * inv + 127) // 255
+                dst[y, x, 1] = (src[y, x, 1] * a + 255 * inv + 127) // 255
+                dst[y, x, 2] = (src[y, x, 2] * a + 255 * inv + 127) // 255
+except ImportError:
+    _rgba_to_rgb = None
+
+# Per-thread composite buffer pool for _flatten_rgba. Grown to the largest
+# frame a thread has seen and reused, so an N-image RGBA batch performs one
+# background allocation per worker instead of one per image. Thread-local
+# because pages are prepared on pool workers; Image.fromarray copies RGB
+# data out of the buffer, so reuse can't corrupt pages already in flight.
+_flatten_pool = threading.local()
+
+# Raw pixel payload used to move prepared pages between processes:
+# (mode, size, pixel bytes, palette or None). PIL Image objects pickle
+# poorly, raw bytes cross the process boundary cheaply.
+_RawPage = Tuple[str, Tuple[int, int], bytes, Optional[List[int]]]
+_PreparedPage = Union[Image.Image, _RawPage]
+
+# Prepared-page memo: (abspath, mtime, max_size, color_mode) -> raw payload.
+# Preparation is deterministic in that key, so repeated conversions of the
+# same sources skip the decode/resize entirely. LRU-bounded by byte size.
+_PAGE_CACHE: "OrderedDict[Tuple[str, float, int, str], _RawPage]" = OrderedDict()
+_PAGE_CACHE_LOCK = threading.Lock()
+_PAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_page_cache_bytes = 0
+
+
+def _page_cache_get(key: Tuple[str, float, int, str]) -> Optional[_RawPage]:
+    """Return a cached page payload, refreshing its LRU position."""
+    with _PAGE_CACHE_LOCK:
+        raw = _PAGE_CACHE.get(key)
+        if raw is not None:
+            _PAGE_CACHE.move_to_end(key)
+        return raw
+
+
+def _page_cache_put(key: Tuple[str, float, int, str], raw: _RawPage) -> None:
+    """Store a page payload, evicting least-recently-used entries to fit."""
+    global _page_cache_bytes
+    size = len(raw[2])
+    if size > _PAGE_CACHE_MAX_BYTES:
+        return
+    with _PAGE_CACHE_LOCK:
+        old = _PAGE_CACHE.pop(key, None)
+        if old is not None:
+            _page_cache_bytes -= len(old[2])
+        while _page_cache_bytes + size > _PAGE_CACHE_MAX_BYTES and _PAGE_CACHE:
+            _, evicted = _PAGE_CACHE.popitem(last=False)
+            _page_cache_bytes -= len(evicted[2])
+        _PAGE_CACHE[key] = raw
+        _page_cache_bytes += size
 
 
 class ImageToPDFConverter:
@@ -25,7 +174,8 @@ class ImageToPDFConverter:
     Provides both programmatic API and interactive CLI features.
 
     Attributes:
-        supported_formats: Set of supported image file extensions.
+        supported_formats: Frozenset of supported image file extensions,
+            shared by all instances.
 
     Example:
         >>> converter = ImageToPDFConverter()
@@ -33,12 +183,24 @@ class ImageToPDFConverter:
         >>> converter.convert_to_pdf(images, "output.pdf")
     """
 
-    def __init__(self) -> None:
-        """Initialize the converter with supported image formats."""
-        self.supported_formats: Set[str] = {
-            ".jpg", ".jpeg", ".png", ".webp",
-            ".heic", ".heif", ".bmp", ".tiff", ".tif"
-        }
+    # Class-level constants shared by all instances: the tuple feeds
+    # str.endswith (a C-level scan), the frozenset serves membership tests,
+    # and the display string is rendered once for error messages.
+    _SUFFIX_TUPLE: ClassVar[Tuple[str, ...]] = (
+        ".jpg", ".jpeg", ".png", ".webp",
+        ".heic", ".heif", ".bmp", ".tiff", ".tif"
+    )
+    supported_formats: ClassVar[FrozenSet[str]] = frozenset(_SUFFIX_TUPLE)
+    _SUPPORTED_DISPLAY: ClassVar[str] = ", ".join(sorted(supported_formats))
+    # Common case variants pre-expanded at class load (".jpg", ".JPG",
+    # ".Jpg") so the per-entry directory filter is one frozenset lookup
+    # with no str.lower() allocation; oddly-cased suffixes still match
+    # through a case-folded fallback.
+    _MATCH_SUFFIXES: ClassVar[FrozenSet[str]] = frozenset(
+        variant
+        for ext in _SUFFIX_TUPLE
+        for variant in (ext, ext.upper(), ext[0] + ext[1:].capitalize())
+    )
 
     def find_images(
         self,
@@ -52,7 +214,7 @@ class ImageToPDFConverter:
                 to search for images.
 
         Returns:
-            A sorted list of absolute paths to found images.
+            A list of absolute paths to found images, sorted by filename.
 
         Example:
             >>> converter = ImageToPDFConverter()
@@ -61,27 +223,51 @@ class ImageToPDFConverter:
         """
         images: List[str] = []
 
+        # Work on plain strings throughout: pathlib allocates a PurePath
+        # (with string parsing) per operation, which adds up on big scans.
         if isinstance(directory_or_files, (str, Path)):
-            path = Path(directory_or_files)
-            if path.is_dir():
-                for file in path.iterdir():
-                    if file.is_file() and file.suffix.lower() in self.supported_formats:
-                        images.append(str(file.resolve()))
-            elif path.is_file():
-                if path.suffix.lower() in self.supported_formats:
-                    images.append(str(path.resolve()))
+            source = os.fspath(directory_or_files)
+            # A single path with a supported extension is taken to be an
+            # image file without a stat syscall; existence is checked when
+            # the file is actually opened during conversion.
+            if source[source.rfind("."):].lower() in self.supported_formats:
+                return [os.path.abspath(source)]
+            if os.path.isdir(source):
+                self._scan_directory(source, images)
         else:
             for item in directory_or_files:
-                item_path = Path(item)
-                if item_path.is_file():
-                    if item_path.suffix.lower() in self.supported_formats:
-                        images.append(str(item_path.resolve()))
-                elif item_path.is_dir():
-                    for file in item_path.iterdir():
-                        if file.is_file() and file.suffix.lower() in self.supported_formats:
-                            images.append(str(file.resolve()))
+                item_str = os.fspath(item)
+                if os.path.isfile(item_str):
+                    if item_str[item_str.rfind("."):].lower() in self.supported_formats:
+                        images.append(os.path.abspath(item_str))
+                elif os.path.isdir(item_str):
+                    self._scan_directory(item_str, images)
+
+        images.sort(key=os.path.basename)
+        return images
 
-        return sorted(images)
+    def _scan_directory(self, directory: str, images: List[str]) -> None:
+        """
+        Append supported images found in ``directory`` to ``images``.
+
+        Uses ``os.scandir`` so the file-type check comes from the directory
+        read itself instead of a stat syscall per entry.
+
+        Args:
+            directory: Directory to scan (non-recursive).
+            images: List to append found image paths to.
+        """
+        variants = self._MATCH_SUFFIXES
+        folded = self.supported_formats
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                # rfind returns -1 for dotless names, slicing the last
+                # character, which never matches a suffix.
+                suffix = name[name.rfind("."):]
+                if ((suffix in variants or suffix.lower() in folded)
+                        and entry.is_file(follow_symlinks=False)):
+                    images.append(os.path.abspath(entry.path))
 
     def display_images_with_numbers(self, images: List[str]) -> None:
         """
@@ -90,13 +276,14 @@ class ImageToPDFConverter:
         Args:
             images: List of image file paths to display.
         """
-        print("\n" + "=" * 60)
-        print("FOUND IMAGES:")
-        print("=" * 60)
-        for i, img_path in enumerate(images, 1):
-            filename = os.path.basename(img_path)
-            print(f"{i:2d}. {filename}")
-        print("=" * 60)
+        # Build the listing once and emit it with a single print so large
+        # listings don't pay a TTY flush per line.
+        listing = "\n".join(
+            f"{i:2d}. {os.path.basename(img_path)}"
+            for i, img_path in enumerate(images, 1)
+        )
+        print("\n" + "=" * 60 + "\nFOUND IMAGES:\n" + "=" * 60
+              + "\n" + listing + "\n" + "=" * 60)
 
     def get_user_ordering_preference(self, images: List[str]) -> List[str]:
         """
@@ -140,12 +327,9 @@ class ImageToPDFConverter:
                 order_input = input("Order: ").strip()
                 order_numbers = [int(x.strip()) for x in order_input.split()]
 
-                if len(order_numbers) != len(images):
-                    print(f"Error: Please specify exactly {len(images)} numbers.")
-                    continue
-
-                if set(order_numbers) != set(range(1, len(images) + 1)):
-                    print(f"Error: Please use each number from 1 to {len(images)} exactly once.")
+                error = self._validate_order(order_numbers, len(images))
+                if error:
+                    print(f"Error: {error}")
                     continue
 
                 ordered_images = [images[i - 1] for i in order_numbers]
@@ -165,12 +349,408 @@ class ImageToPDFConverter:
             except ValueError:
                 print("Error: Please enter only numbers separated by spaces.")
 
+    @staticmethod
+    def _validate_order(order_numbers: List[int], count: int) -> Optional[str]:
+        """
+        Validate that ``order_numbers`` is a permutation of 1..``count``.
+
+        Uses a single counting pass instead of building two sets, and
+        pinpoints the first offending number in the error message.
+
+        Args:
+            order_numbers: The numbers entered by the user.
+            count: Expected amount of numbers.
+
+        Returns:
+            An error message, or None if the ordering is valid.
+        """
+        if len(order_numbers) != count:
+            return f"Please specify exactly {count} numbers."
+
+        seen = bytearray(count)
+        for number in order_numbers:
+            if not 1 <= number <= count:
+                return f"{number} is out of range (use numbers 1 to {count})."
+            if seen[number - 1]:
+                return f"{number} appears more than once."
+            seen[number - 1] = 1
+
+        return None
+
+    def _prepare_one(
+        self,
+        img_path: str,
+        max_size: int,
+        color_mode: str = "auto",
+        cache: bool = True
+    ) -> Image.Image:
+        """
+        Decode a single image and prepare it for PDF embedding.
+
+        Converts to RGB if necessary and scales down so neither dimension
+        exceeds ``max_size``. The resize uses cykooz.resizer's SIMD lanczos3
+        kernel when available, falling back to Pillow's scalar LANCZOS.
+        With ``color_mode="auto"``, grayscale-content pages are converted
+        to single-channel "L", which the PDF encoder stores at a third of
+        the data.
+        Safe to call from worker threads: Pillow's decode, convert, and
+        resize release the GIL in native code.
+
+        Args:
+            img_path: Path to the image file.
+            max_size: Maximum dimension (width or height) for resizing.
+            color_mode: "auto" to store grayscale content single-channel,
+                "rgb" to keep every page as 24-bit RGB.
+            cache: Reuse (and populate) the in-process prepared-page cache,
+                keyed on path, mtime, max_size, and color_mode.
+
+        Returns:
+            The prepared in-memory image.
+        """
+        cache_key = None
+        if cache:
+            try:
+                cache_key = (os.path.abspath(img_path),
+                             os.path.getmtime(img_path), max_size, color_mode)
+            except OSError:
+                # Missing file: fall through so Image.open raises the
+                # caller-visible error.
+                pass
+            if cache_key is not None:
+                cached = _page_cache_get(cache_key)
+                if cached is not None:
+                    return _image_from_raw(cached)
+
+        # Open without a context manager: load() decodes the pixels and
+        # releases the file handle, so no defensive copy() is needed to
+        # keep the image alive past this call. convert() and resize()
+        # return new images detached from the file anyway. The except
+        # below closes the handle deterministically when decoding fails
+        # partway, rather than leaving the descriptor to the GC.
+        if img_path.lower().endswith(_HEIF_SUFFIXES):
+            _ensure_heif()
+
+        img = Image.open(img_path)
+        try:
+            # Fast path: an RGB JPEG already within max_size needs no
+            # convert, resize, or palette probe. Return it unloaded and let
+            # the PDF encoder pull the pixels lazily when it writes the page.
+            if (img.format == "JPEG" and img.mode == "RGB"
+                    and max(img.width, img.height) <= max_size):
+                return img
+
+            # Opaque sources needing a downscale can go through libvips,
+            # which fuses decode and resize into one streamed pass.
+            prepared = None
+            if (_pyvips is not None and img.mode == "RGB"
+                    and max(img.width, img.height) > max_size
+                    and not img_path.lower().endswith(_HEIF_SUFFIXES)):
+                prepared = self._vips_thumbnail(img_path, max_size)
+                if prepared is not None:
+                    img.close()
+                    img = prepared
+
+            if prepared is None:
+                # For JPEGs, let libjpeg decode directly at a reduced scale:
+                # draft() skips the IDCT of high-frequency coefficients,
+                # never undershooting the requested size, and the final
+                # resize handles the exact scaling.
+                if img.format == "JPEG":
+                    img.draft("RGB", (max_size, max_size))
+
+                img.load()
+
+                # Convert to RGB if necessary (required for PDF).
+                # Transparent images are matted onto white before the resize
+                # so the Lanczos pass runs on three channels instead of four.
+                if img.mode == "RGBA":
+                    img = self._flatten_rgba(img)
+                elif img.mode != "RGB":
+                    img = img.convert("RGB")
+
+                # Resize if too large
+                if max(img.width, img.height) > max_size:
+                    img = self._resize(img, max_size)
+
+            # Grayscale-content pages (scans, documents, line art) encode as
+            # single-channel JPEG in the PDF at a third of the data; photos
+            # blow past the color cap immediately and stay RGB. Palette mode
+            # is deliberately not used: Pillow's PDF writer stores "P" pages
+            # uncompressed (ASCIIHexDecode), which inflates output.
+            if color_mode == "auto" and img.mode == "RGB":
+                colors = img.getcolors(maxcolors=4096)
+                if colors is not None and all(r == g == b for _, (r, g, b) in colors):
+                    img = img.convert("L")
+        except Exception:
+            img.close()
+            raise
+
+        if cache_key is not None:
+            palette = img.getpalette() if img.mode == "P" else None
+            _page_cache_put(cache_key, (img.mode, img.size, img.tobytes(), palette))
+
+        return img
+
+    @staticmethod
+    def _ensure_pdf_suffix(output_path: Union[str, Path]) -> Path:
+        """
+        Normalize an output path to carry a .pdf suffix.
+
+        Args:
+            output_path: The requested output path.
+
+        Returns:
+            The path as a ``Path``, with ``.pdf`` appended if missing.
+        """
+        output_path = Path(output_path)
+        if output_path.suffix.lower() == ".pdf":
+            return output_path
+        # Append rather than with_suffix(), which would replace the last
+        # dotted segment of names like "vacation.2024".
+        return Path(os.fspath(output_path) + ".pdf")
+
+    @staticmethod
+    def _prepare_pipeline(
+        images: List[str],
+        prepare_fn: Callable[[str], "_PreparedPage"],
+        use_processes: bool = False
+    ) -> Iterator["_PreparedPage"]:
+        """
+        Yield prepared results in input order while decoding runs ahead.
+
+        A feeder thread submits work to a worker pool and parks the futures
+        on a bounded queue, so image decoding/resizing overlaps with the PDF
+        encoding happening in the consumer while keeping at most
+        ``2 * cpu_count`` frames in flight.
+
+        Args:
+            images: Image paths to prepare, in page order.
+            prepare_fn: Callable preparing a single path. Must be picklable
+                (a module-level function) when ``use_processes`` is True.
+            use_processes: Use a process pool instead of threads, for
+                workloads whose decoders hold the GIL.
+
+        Yields:
+            One prepared result per input path, in order.
+        """
+        workers = os.cpu_count() or 1
+        inflight: queue.Queue = queue.Queue(maxsize=2 * workers)
+        stop = threading.Event()
+
+        if use_processes:
+            executor_cm = ProcessPoolExecutor(
+                max_workers=workers, initializer=_ensure_heif
+            )
+        else:
+            executor_cm = ThreadPoolExecutor(max_workers=workers)
+
+        with executor_cm as executor:
+
+            def put_unless_stopped(item: object) -> None:
+                # Bounded put that gives up once the consumer is gone, so
+                # an abandoned generator can't leave the feeder blocked.
+                while not stop.is_set():
+                    try:
+                        inflight.put(item, timeout=0.1)
+                        return
+                    except queue.Full:
+                        continue
+
+            def feed() -> None:
+                # The end marker is always delivered (None on success, the
+                # feeder's exception otherwise): if submit raises — e.g.
+                # BrokenProcessPool after a worker dies — the consumer must
+                # see it rather than block on the queue forever.
+                end_marker: Optional[BaseException] = None
+                try:
+                    for img_path in images:
+                        future = executor.submit(prepare_fn, img_path)
+                        put_unless_stopped(future)
+                        if stop.is_set():
+                            future.cancel()
+                            return
+                except BaseException as exc:
+                    end_marker = exc
+                finally:
+                    put_unless_stopped(end_marker)
+
+            feeder = threading.Thread(target=feed, daemon=True)
+            feeder.start()
+
+            try:
+                while True:
+                    item = inflight.get()
+                    if item is None:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield item.result()
+            finally:
+                stop.set()
+
+    @staticmethod
+    def _vips_thumbnail(img_path: str, max_size: int) -> Optional[Image.Image]:
+        """
+        Decode and downscale through libvips' streamed pipeline.
+
+        vips pulls scanlines on demand, so decoding and resizing fuse into
+        one pass with a rolling window of rows instead of a full-resolution
+        intermediate frame.
+
+        Args:
+            img_path: Path to the image file.
+            max_size: Maximum dimension (width or height).
+
+        Returns:
+            The resized RGB image, or None if vips can't handle the file
+            (the caller then falls back to the Pillow path).
+        """
+        try:
+            # no_rotate keeps vips from applying EXIF orientation, which
+            # the Pillow path doesn't do either — output must not depend
+            # on which backend handled the file.
+            thumb = _pyvips.Image.thumbnail(
+                img_path, max_size, height=max_size, size="down", no_rotate=True
+            )
+            if thumb.bands != 3 or thumb.format != "uchar":
+                return None
+            return Image.frombytes(
+                "RGB", (thumb.width, thumb.height), thumb.write_to_memory()
+            )
+        except _pyvips.Error:
+            return None
+
+    @staticmethod
+    def _can_embed_losslessly(images: List[str], max_size: int) -> bool:
+        """
+        Check whether every input can skip the preparation pipeline.
+
+        True only if all inputs are RGB JPEGs already within ``max_size``,
+        in which case their compressed bitstreams can be embedded into the
+        PDF as-is. Reads only headers, not pixel data.
+
+        Args:
+            images: Image paths to inspect.
+            max_size: Maximum allowed dimension.
+
+        Returns:
+            True if the batch qualifies for lossless embedding.
+        """
+        for img_path in images:
+            if not img_path.lower().endswith((".jpg", ".jpeg")):
+                return False
+            with Image.open(img_path) as img:
+                if (img.format != "JPEG" or img.mode != "RGB"
+                        or max(img.width, img.height) > max_size):
+                    return False
+        return True
+
+    @staticmethod
+    def _flatten_rgba(img: Image.Image) -> Image.Image:
+        """
+        Flatten an RGBA image onto a white background.
+
+        With numpy, composites into a pooled per-thread buffer (via the
+        parallel Numba kernel when that is installed too); otherwise
+        pastes onto a white canvas through the alpha channel with Pillow.
+
+        Args:
+            img: The RGBA source image.
+
+        Returns:
+            The flattened RGB image.
+        """
+        if np is not None:
+            h, w = img.height, img.width
+            buf = getattr(_flatten_pool, "bg", None)
+            if buf is None or buf.shape[0] < h or buf.shape[1] < w:
+                buf = np.empty((h, w, 3), dtype=np.uint8)
+                _flatten_pool.bg = buf
+            dst = buf[:h, :w]
+            src = np.asarray(img)
+            if _rgba_to_rgb is not None:
+                _rgba_to_rgb(src, dst)
+            else:
+                alpha = src[:, :, 3:].astype(np.uint16)
+                blended = src[:, :, :3] * alpha + (255 - alpha) * 255 + 127
+                np.floor_divide(blended, 255, out=dst, casting="unsafe")
+            return Image.fromarray(dst)
+
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+
+    @staticmethod
+    def _resize(img: Image.Image, max_size: int) -> Image.Image:
+        """
+        Scale ``img`` down so neither dimension exceeds ``max_size``.
+
+        Args:
+            img: Source image (larger than ``max_size`` in at least one axis).
+            max_size: Maximum dimension for the result.
+
+        Returns:
+            A new resized image.
+        """
+        scale = max_size / max(img.width, img.height)
+        dst_w = max(1, round(img.width * scale))
+        dst_h = max(1, round(img.height * scale))
+
+        resizer = _get_resizer()
+        if resizer is not None:
+            dst = Image.new(img.mode, (dst_w, dst_h))
+            resizer.resize_pil(img, dst)
+            return dst
+
+        # For large downscales, a box-filter reduce() pre-pass before the
+        # Lanczos convolution is visually indistinguishable but much cheaper.
+        reducing_gap = 3.0 if max(img.width, img.height) / max_size >= 2.5 else None
+        return img.resize(
+            (dst_w, dst_h),
+            resample=Image.Resampling.LANCZOS,
+            reducing_gap=reducing_gap,
+        )
+
+    def _convert_single(
+        self,
+        img_path: str,
+        output_path: Path,
+        max_size: int,
+        resolution: float,
+        color_mode: str,
+        cache: bool
+    ) -> None:
+        """
+        Write a one-page PDF without any pipeline machinery.
+
+        Single-image jobs are the most common invocation, and spinning up
+        a worker pool, feeder thread, and bounded queue for one page costs
+        more than the page itself. This path is just prepare + save.
+
+        Args:
+            img_path: Path to the single source image.
+            output_path: Destination PDF path (suffix already normalized).
+            max_size: Maximum dimension (width or height) for resizing.
+            resolution: PDF resolution in DPI.
+            color_mode: Color handling, as for ``_prepare_one``.
+            cache: Use the in-process prepared-page cache.
+        """
+        img = self._prepare_one(img_path, max_size, color_mode, cache)
+        try:
+            with open(output_path, "wb", buffering=1 << 20) as fh:
+                img.save(fh, format="PDF", resolution=resolution)
+        finally:
+            img.close()
+
     def convert_to_pdf(
         self,
         images: List[str],
         output_path: Union[str, Path],
         max_size: int = 2000,
-        resolution: float = 100.0
+        resolution: float = 100.0,
+        color_mode: str = "auto",
+        executor: str = "auto",
+        cache: bool = True
     ) -> bool:
         """
         Convert a list of images to a single PDF file.
@@ -181,6 +761,15 @@ class ImageToPDFConverter:
             max_size: Maximum dimension (width or height) for image resizing.
                 Images larger than this will be scaled down. Defaults to 2000.
             resolution: PDF resolution in DPI. Defaults to 100.0.
+            color_mode: "auto" (default) stores grayscale-content pages as
+                single-channel for smaller output; "rgb" keeps every page
+                as 24-bit RGB.
+            executor: Worker pool for image preparation. "auto" (default)
+                uses threads unless the batch is HEIC-majority, "thread"
+                and "process" force the respective pool.
+            cache: Reuse prepared pages across conversions in this process
+                when the source file and settings are unchanged. Defaults
+                to True.
 
         Returns:
             True if conversion was successful, False otherwise.
@@ -199,43 +788,108 @@ class ImageToPDFConverter:
             print("No images found!")
             return False
 
-        output_path = Path(output_path)
-        if not output_path.suffix.lower() == ".pdf":
-            output_path = output_path.with_suffix(".pdf")
+        output_path = self._ensure_pdf_suffix(output_path)
 
         try:
-            pdf_images: List[Image.Image] = []
             print(f"\nProcessing {len(images)} images...")
 
-            for i, img_path in enumerate(images, 1):
-                print(f"Processing image {i}/{len(images)}: {os.path.basename(img_path)}")
-
-                with Image.open(img_path) as img:
-                    # Convert to RGB if necessary (required for PDF)
-                    if img.mode != "RGB":
-                        img = img.convert("RGB")
+            # Ensure output directory exists
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                    # Resize if too large
-                    if max(img.width, img.height) > max_size:
-                        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            # When every input is a JPEG that needs no preparation, img2pdf
+            # embeds the original bitstreams under /DCTDecode — no decode,
+            # no re-encode, and no generation loss. The layout function
+            # pins the page geometry to ``resolution``, matching the DPI
+            # the Pillow writer would use for the same inputs.
+            if _img2pdf is not None and self._can_embed_losslessly(images, max_size):
+                layout_fun = _img2pdf.get_fixed_dpi_layout_fun(
+                    (resolution, resolution)
+                )
+                with open(output_path, "wb", buffering=1 << 20) as fh:
+                    fh.write(_img2pdf.convert(list(images), layout_fun=layout_fun))
+                print(f"\n✅ PDF created successfully: {output_path}")
+                print(f"📄 Total pages: {len(images)}")
+                return True
 
-                    pdf_images.append(img.copy())
+            if len(images) == 1:
+                self._convert_single(
+                    images[0], output_path, max_size, resolution,
+                    color_mode, cache
+                )
+                print(f"\n✅ PDF created successfully: {output_path}")
+                print("📄 Total pages: 1")
+                return True
 
-            if pdf_images:
-                # Ensure output directory exists
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Decode/convert/resize in parallel. Pillow releases the GIL in
+            # its native code, so threads normally give near-linear speedup.
+            # HEIC decoding holds the GIL on single-threaded libheif builds,
+            # so HEIC-majority batches go to a process pool instead, with
+            # pages crossing back as raw bytes. Callers whose inputs are
+            # GIL-bound for other reasons can force executor="process".
+            if executor == "auto":
+                heif_count = sum(p.lower().endswith(_HEIF_SUFFIXES) for p in images)
+                use_processes = len(images) > 1 and heif_count * 2 > len(images)
+            else:
+                use_processes = executor == "process" and len(images) > 1
 
-                pdf_images[0].save(
-                    str(output_path),
-                    save_all=True,
-                    append_images=pdf_images[1:],
-                    format="PDF",
-                    resolution=resolution
+            if use_processes:
+                prepare_fn = functools.partial(
+                    _prepare_raw, max_size=max_size, color_mode=color_mode,
+                    cache=cache
+                )
+                raw_pages = self._prepare_pipeline(
+                    images, prepare_fn, use_processes=True
+                )
+                prepared_stream = (_image_from_raw(raw) for raw in raw_pages)
+            else:
+                prepared_stream = self._prepare_pipeline(
+                    images,
+                    lambda p: self._prepare_one(p, max_size, color_mode, cache)
                 )
 
-                print(f"\n✅ PDF created successfully: {output_path}")
-                print(f"📄 Total pages: {len(pdf_images)}")
-                return True
+            # Only print every ~1% of the batch so stdout flushes don't
+            # dominate throughput on large jobs of small images.
+            progress_step = max(1, len(images) // 100)
+
+            def with_progress() -> Iterator[Image.Image]:
+                for done_count, (img_path, img) in enumerate(
+                        zip(images, prepared_stream), 1):
+                    if done_count % progress_step == 0 or done_count == len(images):
+                        print(f"Processed image {done_count}/{len(images)}: "
+                              f"{os.path.basename(img_path)}")
+                    yield img
+
+            prepared = with_progress()
+
+            # Append one page at a time instead of handing Pillow the whole
+            # batch via append_images, which materializes every page before
+            # encoding. Each appended page is closed immediately, so peak
+            # memory is one page plus the frames in flight in the pipeline.
+            first = next(prepared)
+            try:
+                # The PDF writer emits many small object-stream writes; a
+                # 1 MiB userspace buffer batches them before each syscall.
+                with open(output_path, "wb", buffering=1 << 20) as fh:
+                    first.save(fh, format="PDF", resolution=resolution)
+            finally:
+                first.close()
+
+            for page_count, img in enumerate(prepared, 2):
+                try:
+                    img.save(
+                        output_path,
+                        format="PDF",
+                        resolution=resolution,
+                        append=True
+                    )
+                finally:
+                    img.close()
+                if page_count % 50 == 0:
+                    gc.collect()
+
+            print(f"\n✅ PDF created successfully: {output_path}")
+            print(f"📄 Total pages: {len(images)}")
+            return True
 
         except FileNotFoundError as e:
             print(f"❌ Error: Image file not found: {e}")
@@ -260,6 +914,10 @@ class ImageToPDFConverter:
         This method provides an interactive experience for converting images to PDF,
         including image discovery, ordering, and output path selection.
 
+        When multiple input paths are given, images keep the order of the
+        paths as passed (sorted within each directory) rather than being
+        re-sorted globally.
+
         Args:
             input_paths: Input image files or directories to process.
             output_path: Optional output PDF path. If not provided, user will be prompted.
@@ -277,11 +935,13 @@ class ImageToPDFConverter:
             all_images: List[str] = []
             for path in input_paths:
                 all_images.extend(self.find_images(path))
-            images = sorted(set(all_images))
+            # Dedup in O(N) while preserving the user's argument order;
+            # each find_images call already returns its group sorted.
+            images = list(dict.fromkeys(all_images))
 
         if not images:
             print("❌ No supported images found!")
-            print(f"Supported formats: {', '.join(sorted(self.supported_formats))}")
+            print(f"Supported formats: {self._SUPPORTED_DISPLAY}")
             return False
 
         # Get user ordering preference
@@ -301,17 +961,13 @@ class ImageToPDFConverter:
                     break
                 elif choice == "2":
                     custom_path = input("Enter full path for PDF (including filename): ").strip()
-                    if not custom_path.lower().endswith(".pdf"):
-                        custom_path += ".pdf"
                     output_path = Path(custom_path)
                     break
                 else:
                     print("Invalid choice. Please enter 1 or 2.")
 
         # Ensure .pdf extension
-        output_path = Path(output_path)
-        if not output_path.suffix.lower() == ".pdf":
-            output_path = output_path.with_suffix(".pdf")
+        output_path = self._ensure_pdf_suffix(output_path)
 
         # Convert
         success = self.convert_to_pdf(ordered_images, output_path)
@@ -321,3 +977,49 @@ class ImageToPDFConverter:
             print(f"📁 File size: {file_size:.2f} MB")
 
         return success
+
+
+def _prepare_raw(
+    img_path: str,
+    max_size: int,
+    color_mode: str,
+    cache: bool = True
+) -> _RawPage:
+    """
+    Prepare one image in a worker process, returning raw pixel data.
+
+    Module-level so it is picklable by ProcessPoolExecutor. The prepared
+    page is serialized as (mode, size, bytes, palette) rather than as a
+    PIL Image, which the parent rebuilds with :func:`_image_from_raw`.
+
+    Args:
+        img_path: Path to the image file.
+        max_size: Maximum dimension (width or height) for resizing.
+        color_mode: Color handling, as for ``_prepare_one``.
+        cache: Use the worker-local prepared-page cache.
+
+    Returns:
+        The raw page payload.
+    """
+    img = ImageToPDFConverter()._prepare_one(img_path, max_size, color_mode, cache)
+    palette = img.getpalette() if img.mode == "P" else None
+    raw: _RawPage = (img.mode, img.size, img.tobytes(), palette)
+    img.close()
+    return raw
+
+
+def _image_from_raw(raw: _RawPage) -> Image.Image:
+    """
+    Rebuild a prepared page from its raw worker-process payload.
+
+    Args:
+        raw: Payload produced by :func:`_prepare_raw`.
+
+    Returns:
+        The reconstructed image.
+    """
+    mode, size, data, palette = raw
+    img = Image.frombytes(mode, size, data)
+    if palette:
+        img.putpalette(palette)
+    return img
@@ -2,39 +2,55 @@
 Unit tests for the ImageToPDFConverter class.
 """
 
+import functools
+import io
 import os
-import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 from PIL import Image
 
 from image_to_pdf.converter import ImageToPDFConverter
 
 
+def _solid(color, size=(100, 100), mode="RGB"):
+    """Build a solid-color image from a numpy array (one vectorized fill)."""
+    channels = len(mode)
+    array = np.full((size[1], size[0], channels), color, dtype=np.uint8)
+    return Image.fromarray(array, mode)
+
+
+@functools.lru_cache(maxsize=None)
+def _solid_image_bytes(color, fmt="PNG", size=(100, 100)):
+    """Encode a solid-color test image once; repeat callers get cached bytes."""
+    buf = io.BytesIO()
+    _solid(color, size).save(buf, fmt)
+    return buf.getvalue()
+
+
 @pytest.fixture
 def converter():
     """Create a converter instance for testing."""
     return ImageToPDFConverter()
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="session")
+def sample_image_bytes():
+    """Encode the sample PNGs once and share the bytes across all tests."""
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]  # RGB colors
+    return [_solid_image_bytes(color) for color in colors]
 
 
-@pytest.fixture
-def sample_images(temp_dir):
-    """Create sample test images."""
+@pytest.fixture(scope="session")
+def sample_images(tmp_path_factory, sample_image_bytes):
+    """Write the sample PNGs once per session into a shared directory."""
+    samples_dir = tmp_path_factory.mktemp("samples", numbered=False)
     images = []
-    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]  # RGB colors
 
-    for i, color in enumerate(colors, 1):
-        img_path = temp_dir / f"test_image_{i}.png"
-        img = Image.new("RGB", (100, 100), color)
-        img.save(img_path)
+    for i, blob in enumerate(sample_image_bytes, 1):
+        img_path = samples_dir / f"test_image_{i}.png"
+        img_path.write_bytes(blob)
         images.append(str(img_path.resolve()))
 
     return images
@@ -56,9 +72,9 @@ class TestImageToPDFConverterInit:
 class TestFindImages:
     """Tests for the find_images method."""
 
-    def test_find_images_in_directory(self, converter, temp_dir, sample_images):
+    def test_find_images_in_directory(self, converter, sample_images):
         """Test finding images in a directory."""
-        found = converter.find_images(str(temp_dir))
+        found = converter.find_images(str(Path(sample_images[0]).parent))
         assert len(found) == 3
         assert all(f.endswith(".png") for f in found)
 
@@ -74,123 +90,195 @@ class TestFindImages:
         found = converter.find_images(sample_images[:2])
         assert len(found) == 2
 
-    def test_find_images_empty_directory(self, converter, temp_dir):
+    def test_find_images_empty_directory(self, converter, tmp_path):
         """Test finding images in an empty directory."""
-        empty_dir = temp_dir / "empty"
+        empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
         found = converter.find_images(str(empty_dir))
         assert len(found) == 0
 
-    def test_find_images_unsupported_format(self, converter, temp_dir):
+    def test_find_images_unsupported_format(self, converter, tmp_path):
         """Test that unsupported formats are ignored."""
         # Create a non-image file
-        text_file = temp_dir / "document.txt"
+        text_file = tmp_path / "document.txt"
         text_file.write_text("not an image")
 
-        found = converter.find_images(str(temp_dir))
+        found = converter.find_images(str(tmp_path))
         assert len(found) == 0
 
-    def test_find_images_mixed_formats(self, converter, temp_dir):
+    def test_find_images_mixed_formats(self, converter, tmp_path):
         """Test finding images with mixed formats."""
         # Create images with different formats
-        formats = [".jpg", ".png", ".bmp"]
-        for i, ext in enumerate(formats):
-            img = Image.new("RGB", (50, 50), (i * 50, i * 50, i * 50))
-            img.save(temp_dir / f"image{i}{ext}")
+        formats = [(".jpg", "JPEG"), (".png", "PNG"), (".bmp", "BMP")]
+        for i, (ext, fmt) in enumerate(formats):
+            blob = _solid_image_bytes((i * 50, i * 50, i * 50), fmt, (50, 50))
+            (tmp_path / f"image{i}{ext}").write_bytes(blob)
 
-        found = converter.find_images(str(temp_dir))
+        found = converter.find_images(str(tmp_path))
         assert len(found) == 3
 
-    def test_find_images_returns_sorted(self, converter, temp_dir):
+    def test_find_images_returns_sorted(self, converter, tmp_path):
         """Test that found images are returned sorted."""
+        blob = _solid_image_bytes((255, 255, 255), "PNG", (10, 10))
         for name in ["c_image.png", "a_image.png", "b_image.png"]:
-            img = Image.new("RGB", (10, 10), (255, 255, 255))
-            img.save(temp_dir / name)
+            (tmp_path / name).write_bytes(blob)
 
-        found = converter.find_images(str(temp_dir))
-        filenames = [os.path.basename(f) for f in found]
-        assert filenames == sorted(filenames)
+        found = converter.find_images(str(tmp_path))
+        assert found == sorted(found, key=os.path.basename)
 
-    def test_find_images_with_path_object(self, converter, temp_dir, sample_images):
+    def test_find_images_with_path_object(self, converter, sample_images):
         """Test finding images with Path object input."""
-        found = converter.find_images(temp_dir)
+        found = converter.find_images(Path(sample_images[0]).parent)
         assert len(found) == 3
 
 
 class TestConvertToPdf:
     """Tests for the convert_to_pdf method."""
 
-    def test_convert_single_image(self, converter, temp_dir, sample_images):
+    def test_convert_single_image(self, converter, tmp_path, sample_images):
         """Test converting a single image to PDF."""
-        output = temp_dir / "output.pdf"
+        output = tmp_path / "output.pdf"
         success = converter.convert_to_pdf([sample_images[0]], output)
 
         assert success is True
         assert output.exists()
         assert output.stat().st_size > 0
 
-    def test_convert_multiple_images(self, converter, temp_dir, sample_images):
+    def test_convert_multiple_images(self, converter, tmp_path, sample_images):
         """Test converting multiple images to PDF."""
-        output = temp_dir / "output.pdf"
+        output = tmp_path / "output.pdf"
         success = converter.convert_to_pdf(sample_images, output)
 
         assert success is True
         assert output.exists()
 
-    def test_convert_empty_list(self, converter, temp_dir):
+    def test_convert_empty_list(self, converter, tmp_path):
         """Test converting an empty list of images."""
-        output = temp_dir / "output.pdf"
+        output = tmp_path / "output.pdf"
         success = converter.convert_to_pdf([], output)
 
         assert success is False
         assert not output.exists()
 
-    def test_convert_adds_pdf_extension(self, converter, temp_dir, sample_images):
+    def test_convert_adds_pdf_extension(self, converter, tmp_path, sample_images):
         """Test that .pdf extension is added if missing."""
-        output = temp_dir / "output"  # No extension
+        output = tmp_path / "output"  # No extension
         success = converter.convert_to_pdf([sample_images[0]], output)
 
         assert success is True
         # Check that .pdf was added
-        assert (temp_dir / "output.pdf").exists()
+        assert (tmp_path / "output.pdf").exists()
+
+    def test_convert_appends_pdf_to_dotted_name(self, converter, tmp_path, sample_images):
+        """Test that .pdf is appended to dotted names, not substituted."""
+        output = tmp_path / "album.2024"
+        success = converter.convert_to_pdf([sample_images[0]], output)
 
-    def test_convert_creates_output_directory(self, converter, temp_dir, sample_images):
+        assert success is True
+        assert (tmp_path / "album.2024.pdf").exists()
+
+    def test_convert_creates_output_directory(self, converter, tmp_path, sample_images):
         """Test that output directory is created if it doesn't exist."""
-        output = temp_dir / "subdir" / "nested" / "output.pdf"
+        output = tmp_path / "subdir" / "nested" / "output.pdf"
         success = converter.convert_to_pdf([sample_images[0]], output)
 
         assert success is True
         assert output.exists()
 
-    def test_convert_with_rgba_image(self, converter, temp_dir):
+    def test_convert_with_rgba_image(self, converter, tmp_path):
         """Test converting an RGBA image (with alpha channel)."""
         # Create RGBA image
-        rgba_path = temp_dir / "rgba_image.png"
-        img = Image.new("RGBA", (100, 100), (255, 0, 0, 128))
+        rgba_path = tmp_path / "rgba_image.png"
+        img = _solid((255, 0, 0, 128), mode="RGBA")
         img.save(rgba_path)
 
-        output = temp_dir / "output.pdf"
+        output = tmp_path / "output.pdf"
         success = converter.convert_to_pdf([str(rgba_path)], output)
 
         assert success is True
         assert output.exists()
 
-    def test_convert_with_custom_max_size(self, converter, temp_dir):
+    def test_convert_with_custom_max_size(self, converter, tmp_path):
         """Test converting with custom max size."""
         # Create a large image
-        large_path = temp_dir / "large_image.png"
-        img = Image.new("RGB", (3000, 3000), (255, 255, 255))
+        large_path = tmp_path / "large_image.png"
+        img = _solid((255, 255, 255), (3000, 3000))
         img.save(large_path)
 
-        output = temp_dir / "output.pdf"
+        output = tmp_path / "output.pdf"
+        success = converter.convert_to_pdf([str(large_path)], output, max_size=500)
+
+        assert success is True
+        assert output.exists()
+
+    def test_convert_with_custom_max_size_jpeg(self, converter, tmp_path):
+        """Test the draft-scaled decode path for large JPEGs."""
+        large_path = tmp_path / "large_image.jpg"
+        img = _solid((120, 130, 140), (3000, 3000))
+        img.save(large_path, "JPEG")
+
+        output = tmp_path / "output.pdf"
+        success = converter.convert_to_pdf([str(large_path)], output, max_size=500)
+
+        assert success is True
+        assert output.exists()
+
+    def test_convert_with_pyvips_backend(self, converter, tmp_path):
+        """Test the libvips-backed decode+resize path when pyvips is installed."""
+        pytest.importorskip("pyvips")
+
+        large_path = tmp_path / "large_image.jpg"
+        img = _solid((60, 120, 180), (3000, 2000))
+        img.save(large_path, "JPEG")
+
+        output = tmp_path / "output.pdf"
         success = converter.convert_to_pdf([str(large_path)], output, max_size=500)
 
         assert success is True
         assert output.exists()
 
-    def test_convert_nonexistent_image(self, converter, temp_dir):
+    def test_convert_jpeg_embeds_dct_stream(self, converter, tmp_path):
+        """Test that JPEG inputs end up as DCT-encoded PDF streams."""
+        jpeg_path = tmp_path / "photo.jpg"
+        img = _solid((200, 100, 50))
+        img.save(jpeg_path, "JPEG")
+
+        output = tmp_path / "output.pdf"
+        success = converter.convert_to_pdf([str(jpeg_path)], output)
+
+        assert success is True
+        assert b"/DCTDecode" in output.read_bytes()
+
+    def test_convert_with_process_pool(self, converter, tmp_path, sample_images):
+        """Test converting through the forced process-pool executor."""
+        output = tmp_path / "output.pdf"
+        success = converter.convert_to_pdf(sample_images, output, executor="process")
+
+        assert success is True
+        assert output.exists()
+        assert output.stat().st_size > 0
+
+    def test_convert_does_not_leak_file_handles(self, converter, tmp_path, sample_images):
+        """Test that source file handles are closed after conversion."""
+        if not os.path.exists("/proc/self/fd"):
+            pytest.skip("requires /proc file descriptor accounting")
+
+        # Warm-up run so lazy imports and codec setup don't count as leaks.
+        converter.convert_to_pdf(sample_images, tmp_path / "warmup.pdf")
+
+        # cache=False so the measured run actually reopens every source
+        # instead of serving pages from the prepared-page cache.
+        before = len(os.listdir("/proc/self/fd"))
+        assert converter.convert_to_pdf(
+            sample_images, tmp_path / "output.pdf", cache=False
+        ) is True
+        after = len(os.listdir("/proc/self/fd"))
+
+        assert after <= before
+
+    def test_convert_nonexistent_image(self, converter, tmp_path):
         """Test converting a non-existent image file."""
-        output = temp_dir / "output.pdf"
+        output = tmp_path / "output.pdf"
         success = converter.convert_to_pdf(["/nonexistent/image.png"], output)
 
         assert success is False
@@ -199,7 +287,7 @@ class TestConvertToPdf:
 class TestSupportedFormats:
     """Tests for format support."""
 
-    def test_jpeg_support(self, converter, temp_dir):
+    def test_jpeg_support(self, converter, tmp_path):
         """Test JPEG format support."""
         for ext in [".jpg", ".jpeg"]:
             assert ext in converter.supported_formats